@@ -4,17 +4,23 @@ Yatori Payment Link Generator Skill
 Generate USDC payment request links for the Yatori mobile payment system.
 """
 
-from .yatori_link_generator import (
+from .skill import (
+    acreate_payment_link,
     create_payment_link,
     create_payment_link_with_tracking,
+    create_payment_links,
     generate_yid,
-    validate_solana_address
+    validate_solana_address,
+    validate_solana_addresses
 )
 
 __version__ = "1.0.0"
 __all__ = [
+    "acreate_payment_link",
     "create_payment_link",
     "create_payment_link_with_tracking", 
+    "create_payment_links",
     "generate_yid",
-    "validate_solana_address"
+    "validate_solana_address",
+    "validate_solana_addresses"
 ]
\ No newline at end of file
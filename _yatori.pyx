@@ -0,0 +1,53 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional compiled fast path for skill.py.
+
+Build in place with:
+    cythonize -i _yatori.pyx
+
+skill.py falls back to its pure-Python implementations when this
+extension isn't built.
+"""
+
+import os
+
+cdef bytes _B58_ALPHABET = b"123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+cdef bytes _YID_ALPHABET = b"abcdefghijklmnopqrstuvwxyz234567"
+
+# 1 for bytes in the base58 alphabet, 0 otherwise
+cdef unsigned char _B58_TABLE[256]
+
+cdef Py_ssize_t _i
+for _i in range(256):
+    _B58_TABLE[_i] = 0
+for _i in range(len(_B58_ALPHABET)):
+    _B58_TABLE[_B58_ALPHABET[_i]] = 1
+
+
+cpdef bint validate_solana_address(str address):
+    """Validate a Solana address (base58, 32-44 chars)."""
+    cdef Py_ssize_t n
+    cdef Py_UCS4 c
+    if not address:
+        return False
+    n = len(address)
+    if n < 32 or n > 44:
+        return False
+    for c in address:
+        if c > 127 or not _B58_TABLE[c]:
+            return False
+    return True
+
+
+cpdef str generate_yid(Py_ssize_t length=10):
+    """Generate a random unique transaction ID."""
+    cdef bytes raw = os.urandom(length)
+    cdef const unsigned char *src = raw
+    cdef const unsigned char *alphabet = _YID_ALPHABET
+    cdef bytearray out = bytearray(length)
+    cdef unsigned char *dst = out
+    cdef Py_ssize_t i
+    # 256 is a multiple of 32, so taking the low 5 bits is unbiased
+    for i in range(length):
+        dst[i] = alphabet[src[i] & 31]
+    return out.decode("ascii")
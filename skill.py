@@ -13,26 +13,121 @@ Usage:
     # https://yatori.io/mobile/yatoriRequest?token=usdcBasic...
 """
 
+import functools
+import json
+import os
 import secrets
 import string
 import re
-import requests
-from typing import Optional
-from urllib.parse import urlencode
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Iterable, List, Optional
+from urllib.parse import quote_plus
+
+# Settings such as ACTIVATION_CACHE_TTL are deliberately left out: a star
+# import would copy them, and changing the copy would have no effect.
+__all__ = [
+    "acreate_payment_link",
+    "check_usdc_account_activation",
+    "create_payment_link",
+    "create_payment_link_with_tracking",
+    "create_payment_links",
+    "format_amount",
+    "generate_yid",
+    "validate_amount_range",
+    "validate_solana_address",
+    "validate_solana_addresses",
+]
+
+# Base58 (no 0, O, I, l), 32-44 characters. One compiled match is faster
+# than checking characters against a set, even via frozenset.issuperset().
+_B58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_B58_BYTES = _B58_ALPHABET.encode("ascii")
+_B58_RE = re.compile(r"[1-9A-HJ-NP-Za-km-z]{32,44}\Z")
+
+# yid characters: the lowercase base32 alphabet. 256 is a multiple of 32,
+# so mapping each random byte through this table is unbiased.
+_YID_ALPHABET_BYTES = (string.ascii_lowercase + "234567").encode("ascii")
+_YID_TABLE = bytes(_YID_ALPHABET_BYTES[i % 32] for i in range(256))
+
+# Activation lookups are cached per (address, network) for this many
+# seconds, keeping at most ACTIVATION_CACHE_MAXSIZE entries (LRU eviction).
+ACTIVATION_CACHE_TTL = 300.0
+ACTIVATION_CACHE_MAXSIZE = 1024
+
+_activation_cache = OrderedDict()
+_activation_cache_lock = threading.Lock()
+
+# Activated accounts are also persisted to SQLite for this many seconds so
+# separate processes (e.g. one CLI call per link) skip the lookup too. Only
+# positive results are stored: an account can become activated at any time.
+# Set ACTIVATION_DISK_CACHE_PATH to None to disable.
+ACTIVATION_DISK_CACHE_TTL = 86400.0
+ACTIVATION_DISK_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "yatori",
+    "activation.sqlite3"
+)
+
+# (path, usable) once the schema for that path has been set up
+_disk_cache_state = None
+_disk_cache_lock = threading.Lock()
+
+# After this many consecutive backend failures (connection errors, timeouts,
+# 5xx), skip the backend entirely for CIRCUIT_BREAKER_COOLDOWN seconds
+# instead of waiting out each timeout. Once the cool-off ends a single
+# caller probes the backend while the others keep short-circuiting.
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_BREAKER_COOLDOWN = 30.0
+
+_breaker = {"fails": 0, "open_until": 0.0, "probing": False}
+
+# Shared session so repeated activation checks reuse pooled keep-alive
+# connections instead of paying a fresh TCP+TLS handshake each time.
+# Created on first use so importing the skill doesn't pull in requests.
+_SESSION = None
+_session_lock = threading.Lock()
+
+# Runs activation checks in the background while the link is assembled.
+_EXEC = ThreadPoolExecutor(max_workers=8, thread_name_prefix="yatori-activation")
 
 
 def validate_solana_address(address: str) -> bool:
     """Validate a Solana address (base58, 32-44 chars)."""
-    if not address or len(address) < 32 or len(address) > 44:
-        return False
-    base58_alphabet = set('123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz')
-    return all(c in base58_alphabet for c in address)
+    return bool(address) and _B58_RE.match(address) is not None
+
+
+def validate_solana_addresses(addresses: Iterable[str]) -> List[bool]:
+    """Validate many Solana addresses at once; returns one bool per address."""
+    addresses = list(addresses)
+    
+    # Fast path: one translate over the whole batch. If every character is
+    # base58, only the per-address length check is left.
+    try:
+        blob = "".join(addresses).encode("ascii")
+    except (TypeError, UnicodeEncodeError):
+        blob = None
+    if blob is not None and not blob.translate(None, _B58_BYTES):
+        return [32 <= len(address) <= 44 for address in addresses]
+    
+    results = []
+    for address in addresses:
+        try:
+            raw = address.encode("ascii")
+        except (AttributeError, UnicodeEncodeError):
+            results.append(False)
+            continue
+        # Deleting every base58 byte must leave nothing behind
+        results.append(32 <= len(raw) <= 44 and not raw.translate(None, _B58_BYTES))
+    return results
 
 
 def generate_yid(length: int = 10) -> str:
     """Generate a random unique transaction ID."""
-    alphabet = string.ascii_lowercase + string.digits
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    return secrets.token_bytes(length).translate(_YID_TABLE).decode("ascii")
 
 
 def format_amount(amount: float) -> str:
@@ -40,20 +135,286 @@ def format_amount(amount: float) -> str:
     return f"{amount:.2f}"
 
 
+# Memoized for link building only. Values that compare equal share a cache
+# entry (-0.0 and 0.0, for instance), which is harmless once the amount has
+# passed validate_amount_range but wrong for arbitrary public input.
+_format_valid_amount = functools.lru_cache(maxsize=1024)(format_amount)
+
+
+def _get_session():
+    """Return the shared HTTP session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        with _session_lock:
+            if _SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=16,
+                    # Retry refused connections and 502/503/504 replies, but
+                    # never a read timeout: that would multiply the wait on
+                    # a hung backend by the number of attempts. Retry-After
+                    # is ignored for the same reason; a 503 asking for
+                    # minutes would otherwise block link generation.
+                    max_retries=Retry(
+                        total=2,
+                        read=0,
+                        backoff_factor=0.1,
+                        respect_retry_after_header=False,
+                        status_forcelist=[502, 503, 504],
+                        allowed_methods=frozenset({"POST"})
+                    )
+                ))
+                _SESSION = session
+    return _SESSION
+
+
+def _validate_activation_response(payload) -> dict:
+    """Reject activation responses without a boolean isActivated field."""
+    if not isinstance(payload, dict) or not isinstance(payload.get("isActivated"), bool):
+        raise ValueError(f"Malformed activation response: {payload!r}")
+    return payload
+
+
+def _is_backend_failure(exc: Exception) -> bool:
+    """Whether an activation check error means the backend itself is unhealthy."""
+    import requests
+
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout, requests.exceptions.RetryError)):
+        return True
+    if isinstance(exc, requests.HTTPError):
+        return exc.response is not None and exc.response.status_code >= 500
+    return False
+
+
+def _disk_cache_init(path: str) -> bool:
+    """Create the cache directory and table; returns False if that fails."""
+    import sqlite3
+
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(path, timeout=1.0)
+    except (OSError, sqlite3.Error):
+        return False
+    try:
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS activation ("
+                "address TEXT NOT NULL, network TEXT NOT NULL, "
+                "fetched_at REAL NOT NULL, payload TEXT NOT NULL, "
+                "PRIMARY KEY (address, network))"
+            )
+    except sqlite3.Error:
+        return False
+    finally:
+        conn.close()
+    return True
+
+
+def _disk_cache_connect():
+    """Open the on-disk activation cache, or None if disabled or unusable."""
+    import sqlite3
+
+    global _disk_cache_state
+    path = ACTIVATION_DISK_CACHE_PATH
+    if not path:
+        return None
+    # The directory and schema are set up once per path, not per lookup.
+    # Read the shared state once: _disk_cache_error() may reset it anytime.
+    state = _disk_cache_state
+    if state is None or state[0] != path:
+        with _disk_cache_lock:
+            state = _disk_cache_state
+            if state is None or state[0] != path:
+                state = (path, _disk_cache_init(path))
+                _disk_cache_state = state
+    if not state[1]:
+        return None
+    try:
+        return sqlite3.connect(path, timeout=1.0)
+    except sqlite3.Error:
+        return None
+
+
+def _disk_cache_error() -> None:
+    """Forget the schema setup so the next access redoes it (e.g. file deleted)."""
+    global _disk_cache_state
+    with _disk_cache_lock:
+        _disk_cache_state = None
+
+
+def _disk_cache_get(key: tuple) -> Optional[dict]:
+    """Return a persisted activation result younger than ACTIVATION_DISK_CACHE_TTL."""
+    import sqlite3
+
+    conn = _disk_cache_connect()
+    if conn is None:
+        return None
+    try:
+        row = conn.execute(
+            "SELECT fetched_at, payload FROM activation WHERE address = ? AND network = ?",
+            key
+        ).fetchone()
+    except sqlite3.Error:
+        _disk_cache_error()
+        return None
+    finally:
+        conn.close()
+    if row is None or time.time() - row[0] >= ACTIVATION_DISK_CACHE_TTL:
+        return None
+    try:
+        return _validate_activation_response(json.loads(row[1]))
+    except ValueError:
+        return None
+
+
+def _disk_cache_put(key: tuple, result: dict) -> None:
+    """Persist an activation result; failures are ignored."""
+    import sqlite3
+
+    conn = _disk_cache_connect()
+    if conn is None:
+        return
+    try:
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO activation VALUES (?, ?, ?, ?)",
+                (*key, time.time(), json.dumps(result))
+            )
+    except sqlite3.Error:
+        _disk_cache_error()
+    finally:
+        conn.close()
+
+
+def _memory_cache_get(key: tuple) -> Optional[dict]:
+    """Return a fresh in-memory activation result, dropping it if stale."""
+    with _activation_cache_lock:
+        cached = _activation_cache.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= ACTIVATION_CACHE_TTL:
+            del _activation_cache[key]
+            return None
+        _activation_cache.move_to_end(key)
+    return dict(cached[1])
+
+
+def _memory_cache_put(key: tuple, result: dict) -> None:
+    """Store an activation result, evicting the least recently used entry."""
+    with _activation_cache_lock:
+        _activation_cache[key] = (time.monotonic(), result)
+        _activation_cache.move_to_end(key)
+        while len(_activation_cache) > ACTIVATION_CACHE_MAXSIZE:
+            _activation_cache.popitem(last=False)
+
+
 def check_usdc_account_activation(address: str, network: str = "mainnet-beta") -> dict:
-    """Check if a USDC token account is activated for the given address."""
+    """Check if a USDC token account is activated for the given address.
+
+    Successful lookups are cached (LRU, up to ACTIVATION_CACHE_MAXSIZE
+    entries) for ACTIVATION_CACHE_TTL seconds, and
+    activated accounts are persisted on disk for ACTIVATION_DISK_CACHE_TTL.
+    While the backend is failing repeatedly, checks return "circuit-open"
+    at once.
+    """
+    key = (address, network)
+    cached = _memory_cache_get(key)
+    if cached is not None:
+        return cached
+
+    # While the breaker is open, don't even touch the disk cache
+    with _activation_cache_lock:
+        circuit_open = time.monotonic() < _breaker["open_until"]
+    if circuit_open:
+        return {"isActivated": False, "status": "circuit-open"}
+
+    persisted = _disk_cache_get(key)
+    if persisted is not None:
+        _memory_cache_put(key, persisted)
+        return dict(persisted)
+
+    is_probe = False
+    with _activation_cache_lock:
+        if time.monotonic() < _breaker["open_until"]:
+            circuit_open = True
+        elif _breaker["fails"] >= CIRCUIT_BREAKER_THRESHOLD:
+            # Cool-off over: only the first caller gets to probe the backend
+            circuit_open = _breaker["probing"]
+            is_probe = not circuit_open
+            _breaker["probing"] = True
+        else:
+            circuit_open = False
+    if circuit_open:
+        return {"isActivated": False, "status": "circuit-open"}
+
+    try:
+        return _fetch_activation(key)
+    finally:
+        # Release the probe however the request ended, including
+        # KeyboardInterrupt, so the breaker can't stay half-open forever
+        if is_probe:
+            with _activation_cache_lock:
+                _breaker["probing"] = False
+
+
+def _fetch_activation(key: tuple) -> dict:
+    """Query the activation backend and record the outcome in the breaker and caches."""
+    address, network = key
     try:
-        response = requests.post(
+        response = _get_session().post(
             "https://yumi-muddy-darkness-7179.fly.dev/is-usdc-acct-activated",
             json={"address": address, "network": network},
             headers={"Content-Type": "application/json"},
-            timeout=10
+            timeout=(3.05, 10)
         )
         response.raise_for_status()
-        return response.json()
+        result = _validate_activation_response(response.json())
     except Exception as e:
+        # A rejected request or malformed payload says nothing about the
+        # backend's health, so only real outages count toward the breaker
+        backend_down = _is_backend_failure(e)
+        with _activation_cache_lock:
+            if backend_down:
+                _breaker["fails"] += 1
+                if _breaker["fails"] >= CIRCUIT_BREAKER_THRESHOLD:
+                    _breaker["open_until"] = time.monotonic() + CIRCUIT_BREAKER_COOLDOWN
         return {"isActivated": False, "error": str(e), "status": "Check failed"}
 
+    with _activation_cache_lock:
+        _breaker["fails"] = 0
+    _memory_cache_put(key, result)
+    if result["isActivated"]:
+        _disk_cache_put(key, result)
+    return dict(result)
+
+
+def _clear_activation_cache() -> None:
+    """Drop all cached activation lookups, in memory and on disk."""
+    import sqlite3
+
+    with _activation_cache_lock:
+        _activation_cache.clear()
+    conn = _disk_cache_connect()
+    if conn is None:
+        return
+    try:
+        with conn:
+            conn.execute("DELETE FROM activation")
+    except sqlite3.Error:
+        _disk_cache_error()
+    finally:
+        conn.close()
+
+
+check_usdc_account_activation.cache_clear = _clear_activation_cache
+
 
 def validate_amount_range(amount: float) -> None:
     """Validate amount is within acceptable range ($0.01 to $10,000.00)."""
@@ -102,29 +463,131 @@ def create_payment_link(
     # Validate amount range
     validate_amount_range(amount)
     
-    # Check USDC account activation status
-    activation_check = check_usdc_account_activation(recipient, network)
-    is_activated = activation_check.get("isActivated", False)
-    
-    # Determine token type
+    return _create_link(recipient, amount, yid, token, base_url, network)
+
+
+def _create_link(
+    recipient: str,
+    amount: float,
+    yid: Optional[str] = None,
+    token: Optional[str] = None,
+    base_url: str = "https://yatori.io/mobile/yatoriRequest",
+    network: str = "mainnet-beta"
+) -> str:
+    """Build a payment link from an already validated recipient and amount."""
+    # The activation check only matters when the token type has to be
+    # auto-detected. A cached result is used directly; otherwise the lookup
+    # runs in the background while the rest of the link is assembled.
+    activation = None
+    activation_future = None
     if token is None:
-        token = "usdcBasic" if is_activated else "usdcCreate"
+        activation = _memory_cache_get((recipient, network))
+        if activation is None:
+            activation_future = _EXEC.submit(check_usdc_account_activation, recipient, network)
     
-    # Generate yid if not provided
+    # Generate yid if not provided. Generated IDs and validated addresses
+    # are already URL-safe; only caller-supplied values need quoting.
     if yid is None:
         yid = generate_yid()
+    else:
+        yid = quote_plus(str(yid), safe="")
     
-    # Build query parameters
-    params = {
-        "token": token,
-        "to": recipient,
-        "amount": format_amount(amount),
-        "yid": yid
-    }
+    formatted_amount = _format_valid_amount(amount)
+    
+    # Determine token type
+    if token is None:
+        if activation_future is not None:
+            activation = activation_future.result()
+        token = "usdcBasic" if activation.get("isActivated", False) else "usdcCreate"
+    else:
+        token = quote_plus(str(token), safe="")
+    
+    # Construct URL. One f-string is a single join; a cached per-(base_url,
+    # token) prefix builder measured slower because of the extra lookup.
+    # Building bytes instead would encode every str input just to decode
+    # the result again, so the URL stays a str.
+    return f"{base_url}?token={token}&to={recipient}&amount={formatted_amount}&yid={yid}"
+
+
+async def acreate_payment_link(
+    recipient: str,
+    amount: float,
+    yid: Optional[str] = None,
+    token: Optional[str] = None,
+    base_url: str = "https://yatori.io/mobile/yatoriRequest",
+    network: str = "mainnet-beta"
+) -> str:
+    """
+    Async variant of create_payment_link.
+    
+    The activation check runs on the shared worker pool so many links can
+    be generated concurrently with asyncio.gather().
+    """
+    if not validate_solana_address(recipient):
+        raise ValueError(f"Invalid Solana address: {recipient}")
+    
+    validate_amount_range(amount)
     
-    # Construct URL
-    query_string = urlencode(params)
-    return f"{base_url}?{query_string}"
+    if token is None:
+        activation_check = _memory_cache_get((recipient, network))
+        if activation_check is None:
+            import asyncio
+
+            loop = asyncio.get_running_loop()
+            activation_check = await loop.run_in_executor(
+                _EXEC, check_usdc_account_activation, recipient, network
+            )
+        token = "usdcBasic" if activation_check.get("isActivated", False) else "usdcCreate"
+    
+    return _create_link(recipient, amount, yid, token, base_url, network)
+
+
+def create_payment_links(payment_requests: Iterable[dict]) -> List[str]:
+    """
+    Create many payment links at once.
+    
+    Each item is a dict of create_payment_link keyword arguments. Activation
+    checks run concurrently, once per distinct (recipient, network).
+    
+    Returns:
+        Payment URLs in the same order as payment_requests
+        
+    Raises:
+        ValueError: If any recipient address is invalid or amount is out of range
+    """
+    items = [dict(item) for item in payment_requests]
+    
+    # Validate everything up front so a bad item doesn't cost network calls
+    for item in items:
+        if not validate_solana_address(item["recipient"]):
+            raise ValueError(f"Invalid Solana address: {item['recipient']}")
+        validate_amount_range(item["amount"])
+    
+    # One activation check per distinct recipient needing a token; cached
+    # results are used directly, misses run concurrently on the pool
+    activations = {}
+    activation_futures = {}
+    for item in items:
+        if item.get("token") is None:
+            key = (item["recipient"], item.get("network", "mainnet-beta"))
+            if key in activations or key in activation_futures:
+                continue
+            cached = _memory_cache_get(key)
+            if cached is not None:
+                activations[key] = cached
+            else:
+                activation_futures[key] = _EXEC.submit(check_usdc_account_activation, *key)
+    for key, future in activation_futures.items():
+        activations[key] = future.result()
+    
+    links = []
+    for item in items:
+        if item.get("token") is None:
+            key = (item["recipient"], item.get("network", "mainnet-beta"))
+            is_activated = activations[key].get("isActivated", False)
+            item["token"] = "usdcBasic" if is_activated else "usdcCreate"
+        links.append(_create_link(**item))
+    return links
 
 
 def create_payment_link_with_tracking(
@@ -139,8 +602,6 @@ def create_payment_link_with_tracking(
     
     Returns a dictionary with the link and metadata for tracking.
     """
-    from datetime import datetime
-    
     # Generate yid with optional prefix
     random_part = generate_yid(8)
     yid = f"{prefix}{random_part}" if prefix else random_part
@@ -159,6 +620,17 @@ def create_payment_link_with_tracking(
     }
 
 
+# Optional compiled fast path (see _yatori.pyx); keeps the pure-Python
+# versions above when the extension hasn't been built.
+try:
+    from ._yatori import generate_yid, validate_solana_address  # noqa: F811
+except ImportError:
+    try:
+        from _yatori import generate_yid, validate_solana_address  # noqa: F811
+    except ImportError:
+        pass
+
+
 if __name__ == "__main__":
     # Test the skill
     print("🧪 Testing Yatori USDC Request Skill...")
@@ -170,7 +642,7 @@ if __name__ == "__main__":
             recipient="GvCoHGGBR97Yphzc6SrRycZyS31oUYBM8m9hLRtJT7r5",
             amount=5.0
         )
-        print(f"✅ Test 1 PASSED: Generated link")
+        print("✅ Test 1 PASSED: Generated link")
         print(f"   {link[:70]}...")
     except Exception as e:
         print(f"❌ Test 1 FAILED: {e}")
@@ -184,5 +656,27 @@ if __name__ == "__main__":
     except ValueError:
         print("✅ Test 2 PASSED: Correctly rejected amount below minimum")
     
+    print()
+    
+    # Test 3: On-disk activation cache round trip (temporary cache file)
+    import tempfile
+    
+    saved_path = ACTIVATION_DISK_CACHE_PATH
+    with tempfile.TemporaryDirectory() as tmp:
+        ACTIVATION_DISK_CACHE_PATH = os.path.join(tmp, "activation.sqlite3")
+        key = ("4M4fd9JSEgrzbCko9uABWN1E1xhjxPsmMSt6KHf3ZjQ8", "mainnet-beta")
+        _disk_cache_put(key, {"isActivated": True, "status": "test"})
+        with _activation_cache_lock:
+            _activation_cache.clear()
+        hit = check_usdc_account_activation(*key)
+        promoted = _memory_cache_get(key) is not None
+        check_usdc_account_activation.cache_clear()
+        cleared = _disk_cache_get(key) is None and _memory_cache_get(key) is None
+        if hit.get("status") == "test" and promoted and cleared:
+            print("✅ Test 3 PASSED: Disk cache served, promoted and cleared")
+        else:
+            print(f"❌ Test 3 FAILED: hit={hit} promoted={promoted} cleared={cleared}")
+    ACTIVATION_DISK_CACHE_PATH = saved_path
+    
     print()
     print("🎉 Skill ready to use!")